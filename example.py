@@ -31,21 +31,32 @@ camera = PerspectiveCamera(
     lookat=np.mean(start_pos, axis=0) + np.array([0, -3, 3])
     )
 
+# Reuse a single display window and BGR buffer across frames; cvtColor writes
+# into the preallocated buffer instead of allocating a new image per frame (!)
+cv2.namedWindow('sim', cv2.WINDOW_AUTOSIZE)
+bgr = np.empty((480, 640, 3), dtype=np.uint8)
+
+# Control drones to hover 5m above their starting positions facing north;
+# built once as a float32 array and reused every iteration (!)
+setpoint = np.empty((start_pos.shape[0], 4), dtype=np.float32)
+setpoint[:, 0] = start_pos[:, 0]
+setpoint[:, 1] = start_pos[:, 1]
+setpoint[:, 2] = 0
+setpoint[:, 3] = start_pos[:, 2] + 5
+
 # Simulate!
 states = hangar.get_states()
 
 for i in range(1000):
 
-    # Control drones to all fly to same location facing north!
-    setpoint = [(x, y, 0, z + 5) for x, y, z in start_pos]
     hangar.set_all_setpoints(setpoint)
 
     # Advance simulation state
     states = hangar.step()
 
-    # Visualize
-    if i % 5 == 0:
-        rgb = camera.get_image()
-
-        cv2.imshow('', rgb)
+    # Visualize at ~30 FPS; frames that would be dropped are never rendered
+    rgb = camera.get_image_if_due(1 / 30.)
+    if rgb is not None:
+        cv2.cvtColor(rgb, cv2.COLOR_RGBA2BGR, dst=bgr)
+        cv2.imshow('sim', bgr)
         cv2.waitKey(1)
\ No newline at end of file
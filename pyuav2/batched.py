@@ -0,0 +1,134 @@
+import numpy as np
+
+try:
+    import jax
+    import jax.numpy as jnp
+except ImportError:
+    jax = None
+
+
+class BatchedEnvironment:
+    """Optional JAX-accelerated drop-in for `Environment` aimed at batched rollouts.
+
+    Instead of stepping PyBullet drone-by-drone through Python, all drones are
+    advanced in one `jax.jit`-compiled kernel `vmap`'d over the batch. Dynamics
+    are a simplified first-order velocity model (no collisions, no obstacles);
+    use the PyBullet-backed `Environment` when physical accuracy matters.
+    """
+
+    CONTROL_MODES = [
+        "positional", # [x, y, yaw, z]
+        "velocity"    # [vx, vy, vr, vz]
+        ]
+
+    # Gain of the velocity command toward the positional setpoint, maximum
+    # commanded speed, and time constant of the velocity response.
+    KP = 1.0
+    V_MAX = 5.0
+    TAU = 0.5
+
+    def __init__(
+            self,
+            num_drones: int,
+            start_pos: np.ndarray,
+            start_rot: np.ndarray,
+            control_mode: str = "positional",
+            physics_hz: int = 240,
+            num_envs: int | None = None
+        ) -> None:
+        """Initializes a batched environment with specified number of quadcopter UAVs.
+
+        Args:
+            num_drones (int):             Number of drones to simulate per environment.
+            start_pos (np.ndarray):       An Nx3 matrix of starting positions in carthesian XYZ coordinates.
+            start_rot (np.ndarray):       An Nx3 matrix of starting orientations in XYZ euler angles.
+            control_mode (str, optional): Type of control input (i.e., setpoints) to use:
+                                           - "positional" - using control inputs [x, y, yaw, z] (default).
+                                           - "velocity" - using control inputs [vx, vy, vr, vz].
+            physics_hz (int, optional):   Physics update rate (default: 240 hertz).
+            num_envs (int, optional):     When set, simulates `num_envs` independent copies
+                                          of the environment in one kernel; states and
+                                          setpoints gain a leading K axis (default: None).
+        """
+        assert jax is not None, \
+            "BatchedEnvironment requires the optional 'jax' dependency; install with `pip install jax`."
+        assert control_mode in self.CONTROL_MODES, \
+            f"control_mode '{control_mode}' not understood; choose from {self.CONTROL_MODES}"
+        assert num_drones == start_pos.shape[0] == start_rot.shape[0], \
+            f"Number of positions and rotations specified must be equal to num_drones."
+
+        self._num_drones = num_drones
+        self._num_envs = num_envs
+
+        # Drone state as flat SoA arrays over the batch; with num_envs set, all
+        # environments start from the same initial conditions.
+        batch_shape = (num_drones,) if num_envs is None else (num_envs, num_drones)
+
+        self._pos = jnp.broadcast_to(
+            jnp.asarray(start_pos, dtype=jnp.float32), batch_shape + (3,))
+        self._vel = jnp.zeros(batch_shape + (3,), dtype=jnp.float32)
+        self._yaw = jnp.broadcast_to(
+            jnp.asarray(start_rot[:, 2], dtype=jnp.float32), batch_shape)
+        self._yaw_rate = jnp.zeros(batch_shape, dtype=jnp.float32)
+
+        self._setpoints = jnp.zeros(batch_shape + (4,), dtype=jnp.float32)
+        self._states_buf = np.empty(batch_shape + (4, 3), dtype=np.float32)
+
+        # Compile the step kernel once; dt and control mode are baked in at
+        # trace time so the compiled code carries no per-step branching.
+        dt = 1.0 / physics_hz
+
+        def step_one(pos, vel, yaw, yaw_rate, setpoint):
+            if control_mode == "positional":
+                target = jnp.stack([setpoint[0], setpoint[1], setpoint[3]])
+                vel_cmd = jnp.clip(self.KP * (target - pos), -self.V_MAX, self.V_MAX)
+                yaw_rate_cmd = self.KP * (setpoint[2] - yaw)
+            else:
+                vel_cmd = jnp.stack([setpoint[0], setpoint[1], setpoint[3]])
+                yaw_rate_cmd = setpoint[2]
+
+            vel = vel + (vel_cmd - vel) * (dt / self.TAU)
+            yaw_rate = yaw_rate + (yaw_rate_cmd - yaw_rate) * (dt / self.TAU)
+            return pos + vel * dt, vel, yaw + yaw_rate * dt, yaw_rate
+
+        step_batched = jax.vmap(step_one)
+        if num_envs is not None:
+            step_batched = jax.vmap(step_batched)
+
+        self._step_fn = jax.jit(step_batched)
+
+    def set_all_setpoints(self, setpoints: np.ndarray) -> None:
+        """Sets the setpoints of each drone in the environment.
+
+        Args:
+            setpoints (np.ndarray): Nx4 matrix of setpoints; one for each UAV. With
+                                    num_envs set, either a KxNx4 matrix of per-environment
+                                    setpoints, or an Nx4 matrix shared by all environments.
+        """
+        setpoints = jnp.asarray(setpoints, dtype=jnp.float32)
+        self._setpoints = jnp.broadcast_to(setpoints, self._setpoints.shape)
+
+    def get_states(self) -> np.ndarray:
+        """Fetch current states of all drones as one contiguous array.
+
+        Returns:
+            np.ndarray: Nx4x3 matrix of drone states (angular velocity, angular
+                        position, linear velocity and linear position per drone),
+                        matching the layout returned by `Environment.get_states`.
+                        With num_envs set, the matrix is KxNx4x3.
+        """
+        self._states_buf[..., 0, :2] = 0
+        self._states_buf[..., 0, 2] = self._yaw_rate
+        self._states_buf[..., 1, :2] = 0
+        self._states_buf[..., 1, 2] = self._yaw
+        self._states_buf[..., 2, :] = self._vel
+        self._states_buf[..., 3, :] = self._pos
+        return self._states_buf
+
+    def step(self) -> np.ndarray:
+        """Advance simulation state.
+        """
+        self._pos, self._vel, self._yaw, self._yaw_rate = self._step_fn(
+            self._pos, self._vel, self._yaw, self._yaw_rate, self._setpoints
+        )
+        return self.get_states()
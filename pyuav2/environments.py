@@ -14,6 +14,10 @@ class Environment:
         "velocity": 6    # [vx, vy, vr, vz]
     }
 
+    # Padding (in meters) around the drones' bounding volume in the broad-phase;
+    # covers the distance a drone can travel between filter updates.
+    BROADPHASE_MARGIN = 1.0
+
     def __init__(
             self,
             num_drones: int,
@@ -67,6 +71,46 @@ class Environment:
 
         self._env.set_mode(self.CONTROL_MODES[control_mode])
 
+        # Cached so per-tick validation does not walk PyBullet's drone list
+        self._num_drones = num_drones
+
+        # Persistent setpoint buffer reused across set_all_setpoints() calls to avoid
+        # re-allocating and converting a fresh ndarray on every physics tick.
+        self._setpoint_buf = np.empty((num_drones, 4), dtype=np.float32)
+
+        # Contiguous state buffer (one Nx4x3 array instead of a list of per-drone
+        # arrays); updated in-place each step. Camera buffers are allocated lazily
+        # on first use as the frame resolution is not known until then.
+        self._states_buf = np.empty((num_drones, 4, 3), dtype=np.float32)
+        self._rgba_buf = None
+        self._depth_buf = None
+
+        # Read-only view handed out by get_states()/step(); the backing buffer is
+        # updated in place each step, so consumers get fresh values without a copy
+        # but cannot accidentally corrupt simulation state.
+        self._states_view = self._states_buf.view()
+        self._states_view.flags.writeable = False
+
+        # Bind hot references once; step() and the state/image gathers run at up
+        # to physics_hz, where repeated attribute lookups add up.
+        self._drones = self._env.drones
+        self._step_env = self._env.step
+
+        # Broad-phase bookkeeping: axis-aligned bounding boxes of static obstacles
+        # (stored as contiguous Mx3 min/max matrices so all boxes are tested in one
+        # vectorized expression) and whether their narrow-phase checks are enabled.
+        self._drone_ids = [drone.Id for drone in self._drones]
+        self._drone_links = [
+            list(range(-1, self._env.getNumJoints(drone_id)))
+            for drone_id in self._drone_ids
+            ]
+        self._aabb_body_ids = []
+        self._aabb_min = np.empty((0, 3), dtype=np.float32)
+        self._aabb_max = np.empty((0, 3), dtype=np.float32)
+        self._obstacle_active = np.empty(0, dtype=bool)
+
+        self._build_step()
+
     def add_obstacle(
             self,
             path_to_obj: str,
@@ -82,9 +126,36 @@ class Environment:
             mass (float):              Mass of obstacle. If static, set mass=0 (default: 0).
             concave (bool):            Whether the obstacle is concave (default: False).
         """
+        self.add_obstacles([dict(path_to_obj=path_to_obj, position=position, mass=mass, concave=concave)])
+
+    def add_obstacles(self, specs: list[dict]) -> None:
+        """Add multiple obstacles to the environment in one batch; PyBullet's body
+        list is re-indexed once at the end rather than once per obstacle.
+
+        Args:
+            specs (list[dict]): One dict per obstacle holding the keyword arguments
+                                of `add_obstacle` ('path_to_obj' required;
+                                'position', 'mass' and 'concave' optional).
+        """
+        for spec in specs:
+            self._load_obstacle(**spec)
+
+        self._env.register_all_new_bodies()
+        self._build_step()
+
+    def _load_obstacle(
+            self,
+            path_to_obj: str,
+            position: list | np.ndarray = [0, 0, 0],
+            mass: float = 0,
+            concave: bool = False
+            ) -> None:
+        """Load a single obstacle mesh into PyBullet without re-indexing the body
+        list (see `add_obstacles`). Arguments as in `add_obstacle`.
+        """
         visualId = obj_visual(self._env, path_to_obj)
         collisionId = obj_collision(self._env, path_to_obj, concave=concave)
-        
+
         loadOBJ(
             self._env,
             visualId=visualId,
@@ -93,16 +164,80 @@ class Environment:
             basePosition=position,
         )
 
-        self._env.register_all_new_bodies()
+        # Track AABBs of static obstacles for broad-phase culling; dynamic
+        # obstacles (mass > 0) move, so their boxes cannot be cached.
+        if mass == 0:
+            body_id = self._env.getBodyUniqueId(self._env.getNumBodies() - 1)
+            aabb_min, aabb_max = self._mesh_aabb(path_to_obj)
+            self._aabb_body_ids.append(body_id)
+            self._aabb_min = np.vstack([self._aabb_min, aabb_min + position]).astype(np.float32)
+            self._aabb_max = np.vstack([self._aabb_max, aabb_max + position]).astype(np.float32)
+            self._obstacle_active = np.append(self._obstacle_active, True)
+
+    @staticmethod
+    def _mesh_aabb(path_to_obj: str) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the axis-aligned bounding box of a wavefront obj mesh.
+
+        Args:
+            path_to_obj (str): Path to mesh file in wavefront obj format.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (min, max) corners of the bounding box.
+        """
+        vertices = []
+        with open(path_to_obj) as f:
+            for line in f:
+                if line.startswith('v '):
+                    vertices.append([float(t) for t in line.split()[1:4]])
+
+        vertices = np.array(vertices, dtype=np.float32)
+        return vertices.min(axis=0), vertices.max(axis=0)
+
+    def _update_collision_filters(self) -> None:
+        """Broad-phase culling: disables PyBullet's narrow-phase collision checks
+        for static obstacles whose bounding box lies outside the drones' current
+        bounding volume (padded by `BROADPHASE_MARGIN`), re-enabling them when
+        the drones come back into range.
+        """
+        query_min = self._states_buf[:, 3].min(axis=0) - self.BROADPHASE_MARGIN
+        query_max = self._states_buf[:, 3].max(axis=0) + self.BROADPHASE_MARGIN
+
+        # One slab test over all M obstacle boxes at once
+        hits = np.all((query_max >= self._aabb_min) & (query_min <= self._aabb_max), axis=1)
+
+        for i in np.nonzero(hits != self._obstacle_active)[0]:
+            body_id = self._aabb_body_ids[i]
+            enable = int(hits[i])
+            for drone_id, links in zip(self._drone_ids, self._drone_links):
+                for link in links:
+                    self._env.setCollisionFilterPair(drone_id, body_id, link, -1, enable)
+
+        self._obstacle_active = hits
 
     def set_all_setpoints(self, setpoints: np.ndarray) -> None:
         """Sets the setpoints of each drone in the environment.
 
         Args:
-            setpoints (np.ndarray): list of setpoints; one for each UAV.
+            setpoints (np.ndarray): Nx4 matrix (or list of 4-tuples) of setpoints;
+                                    one for each UAV.
         """
-        assert len(setpoints) == len(self._env.drones)
-        self._env.set_all_setpoints(np.array(setpoints, dtype=np.float32))
+        assert len(setpoints) == self._num_drones
+
+        if isinstance(setpoints, np.ndarray) and setpoints.dtype == np.float32:
+            # Caller already supplies float32; no conversion needed
+            self._env.set_all_setpoints(setpoints)
+        else:
+            self._setpoint_buf[:] = setpoints
+            self._env.set_all_setpoints(self._setpoint_buf)
+
+    def set_all_setpoints_array(self, setpoints: np.ndarray) -> None:
+        """Zero-copy variant of `set_all_setpoints` for callers that maintain their
+        own Nx4 float32 setpoint array; the array is passed through unconverted.
+
+        Args:
+            setpoints (np.ndarray): Nx4 float32 matrix of setpoints; one for each UAV.
+        """
+        self._env.set_all_setpoints(setpoints)
 
     def set_setpoint(self, idx: int, setpoint: np.ndarray) -> None:
         """Sets the setpoint of a single UAV, designated by `idx`.
@@ -111,37 +246,97 @@ class Environment:
             idx (int):             ID designating drone to assign setpoint to, where 0 <= idx < N
             setpoint (np.ndarray): Setpoint for given UAV.
         """
-        assert 0 <= idx < len(self._env.drones)
+        assert 0 <= idx < self._num_drones
         self._env.set_setpoint(index=idx, setpoint=np.array(setpoint, dtype=np.float32))
 
-    def get_states(self) -> list:
-        return self._env.all_states
+    def get_states(self) -> np.ndarray:
+        """Fetch current states of all drones as one contiguous array.
+
+        Returns:
+            np.ndarray: Nx4x3 matrix of drone states (angular velocity, angular
+                        position, linear velocity and linear position per drone).
+                        A read-only view into a buffer reused across calls; copy
+                        if retaining.
+        """
+        for i, drone in enumerate(self._drones):
+            self._states_buf[i] = drone.state
 
-    def step(self) -> None:
+        return self._states_view
+
+    def _build_step(self) -> None:
+        """(Re)builds the specialized step implementation bound to `_step_impl`.
+        Called at construction and whenever the scene changes; bakes the drone
+        list and the presence of broad-phase obstacles into a closure so the
+        per-step path carries no attribute lookups or scene-dependent branches.
+        """
+        step_env = self._step_env
+        drones = tuple(enumerate(self._drones))
+        states_buf = self._states_buf
+        states_view = self._states_view
+        update_filters = self._update_collision_filters
+
+        if self._aabb_body_ids:
+            def step_specialized() -> np.ndarray:
+                step_env()
+                for i, drone in drones:
+                    states_buf[i] = drone.state
+                update_filters()
+                return states_view
+        else:
+            def step_specialized() -> np.ndarray:
+                step_env()
+                for i, drone in drones:
+                    states_buf[i] = drone.state
+                return states_view
+
+        self._step_impl = step_specialized
+
+    def step(self) -> np.ndarray:
         """Advance simulation state.
         """
-        self._env.step()
-        return self._env.all_states
+        return self._step_impl()
+
+    def get_camera_images(self, mode: str = "rgba") -> np.ndarray:
+        """Fetch current RGBA or depth images from onboard cameras of drones.
+
+        Args:
+            mode (str): "rgba" or "depth"
+
+        Returns:
+            np.ndarray: Stack of frames of shape (N, height, width, channels), where
+                        channels=1 for mode='depth', and channels=4 for mode='rgba'.
+                        The buffer is reused across calls; copy if retaining.
+        """
+        drones = self._drones
+
+        if mode == 'rgba':
+            if self._rgba_buf is None:
+                self._rgba_buf = np.empty((len(drones), *drones[0].rgbaImg.shape), dtype=np.uint8)
+            for i, drone in enumerate(drones):
+                self._rgba_buf[i] = drone.rgbaImg
+            return self._rgba_buf
+        elif mode == 'depth':
+            if self._depth_buf is None:
+                self._depth_buf = np.empty((len(drones), *drones[0].depthImg.shape), dtype=np.float32)
+            for i, drone in enumerate(drones):
+                self._depth_buf[i] = drone.depthImg
+            return self._depth_buf
+        else:
+            raise Exception(f"Mode '{mode}' not understood.")
 
-    def get_camera_images(self, mode: str = "rgba") -> list[np.ndarray]:
-        """Fetch current RGBA or depth images from onboard cameras of drones. 
+    def get_camera_atlas(self, mode: str = "rgba") -> np.ndarray:
+        """Fetch the onboard camera images of all drones tiled vertically into a
+        single (N*height, width, channels) atlas. As all frames share one
+        contiguous buffer, the atlas is a zero-copy reshape and can be displayed
+        or post-processed in one operation instead of N.
 
         Args:
             mode (str): "rgba" or "depth"
 
         Returns:
-            list[ndarray]: Sequence of frames of shape (height, width, channels), where
-                           channels=1 for mode='depth', and channels=4 for mode='rgba'
+            np.ndarray: Atlas of shape (N*height, width, channels); a view into
+                        the same buffer returned by `get_camera_images`.
         """
-        imgs = []
-        for drone in self._env.drones:
-            if mode == 'rgba':
-                imgs.append(drone.rgbaImg)
-            elif mode == 'depth':
-                imgs.append(drone.depthImg)
-            else:
-                raise Exception(f"Mode '{mode}' not understood.")
-
-        return imgs
-
-    
\ No newline at end of file
+        imgs = self.get_camera_images(mode=mode)
+        return imgs.reshape(-1, *imgs.shape[2:])
+
@@ -1,3 +1,6 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import numpy as np
 import pybullet as pyb
 
@@ -12,8 +15,9 @@ class PerspectiveCamera:
             width: int = 640,
             height: int = 480,
             clip_near: float = 0.1,
-            clip_far: float = 300,
-            shadows: bool = False
+            clip_far: float = 50,
+            shadows: bool = False,
+            resolution_scale: float = 1.0
             ) -> None:
         """Initialize a new perspective camera.
 
@@ -25,21 +29,50 @@ class PerspectiveCamera:
             width (float):             Width of output render (default: 640)
             height (float):            Height of output render (default: 480)
             clip_near (float):         Near clipping plane (default: 0.1m)
-            clip_far (float):          Far clipping plane (default: 300m)
+            clip_far (float):          Far clipping plane (default: 50m). Directly
+                                       limits per-frame vertex/fragment workload;
+                                       keep as tight as the scene allows.
             shadows (bool):            Whether to render shadows (default: True)
+            resolution_scale (float):  Scale factor applied to width/height to trade
+                                       render cost for resolution, e.g. 0.5 renders
+                                       at quarter the pixel count (default: 1.0)
         """
         # PyBullet physicsClientId (!)
         self._client_id = env._env._client
 
         self._fov = fov
-        self._width = width
-        self._height = height
+        self._width = int(width * resolution_scale)
+        self._height = int(height * resolution_scale)
         self._clip_far = clip_far
         self._clip_near = clip_near
         self._shadows = shadows
         self._origin = origin.tolist()
         self._lookat = lookat.tolist()
-        self._upref = [0, 0, 1] # up-reference (!)
+        self._upref = [0, 0, 1]     # up-reference (!)
+        self._light_dir = [1, 1, 1] # direction of light source
+
+        # Cached render flags; built once to avoid re-marshalling per frame
+        self._flags = pyb.ER_NO_SEGMENTATION_MASK
+
+        # Use the hardware OpenGL renderer when a GPU context can be created
+        # (headless machines need the EGL plugin for this); otherwise fall back
+        # to the software TinyRenderer rather than failing per frame.
+        try:
+            egl = pyb.loadPlugin('eglRendererPlugin', physicsClientId=self._client_id)
+        except pyb.error:
+            egl = -1
+        self._renderer = pyb.ER_BULLET_HARDWARE_OPENGL if egl >= 0 else pyb.ER_TINY_RENDERER
+
+        # Single-worker executor for get_image_async(); created on first use
+        self._executor = None
+
+        # Timestamp of the last render, used by get_image_if_due()
+        self._last_render_t = -np.inf
+
+        # Persistent output buffers returned by get_image(); reused across calls
+        # to avoid a frame-sized allocation per render
+        self._out_rgba = np.empty((self._height, self._width, 4), dtype=np.uint8)
+        self._out_depth = np.empty((self._height, self._width, 1), dtype=np.float32)
 
         self._view_matrix = pyb.computeViewMatrix(
             cameraEyePosition=self._origin, 
@@ -56,15 +89,46 @@ class PerspectiveCamera:
             physicsClientId=self._client_id
         )
 
-    def get_image(self, mode: str = "rgba") -> np.ndarray:
-        """Fetch current RGBA or depth image from camera. 
+    def update(self, origin: np.ndarray = None, lookat: np.ndarray = None) -> None:
+        """Move the camera and/or its look-at target, e.g. to track a drone. The
+        cached position lists are mutated in place so per-frame tracking does
+        not allocate new objects; the view matrix is recomputed once per call.
+
+        Args:
+            origin (np.ndarray): New location of camera (default: unchanged)
+            lookat (np.ndarray): New location to view / look at (default: unchanged)
+        """
+        if origin is not None:
+            self._origin[0] = float(origin[0])
+            self._origin[1] = float(origin[1])
+            self._origin[2] = float(origin[2])
+
+        if lookat is not None:
+            self._lookat[0] = float(lookat[0])
+            self._lookat[1] = float(lookat[1])
+            self._lookat[2] = float(lookat[2])
+
+        self._view_matrix = pyb.computeViewMatrix(
+            cameraEyePosition=self._origin,
+            cameraTargetPosition=self._lookat,
+            cameraUpVector=self._upref,
+            physicsClientId=self._client_id
+        )
+
+    def get_image(self, mode: str = "rgba", dtype: np.dtype = None) -> np.ndarray:
+        """Fetch current RGBA or depth image from camera.
 
         Args:
-            mode (str): "rgba" or "depth"
+            mode (str):              "rgba" or "depth"
+            dtype (np.dtype):        Optional output dtype; e.g. np.float16 halves the
+                                     bandwidth of depth frames where half precision
+                                     suffices (default: uint8 for 'rgba', float32
+                                     for 'depth').
 
         Returns:
             np.ndarray: Image frame pf shape (height, width, channels), where
-                        channels=1 for mode='depth', and channels=4 for mode='rgba'
+                        channels=1 for mode='depth', and channels=4 for mode='rgba'.
+                        The buffer is reused across calls; copy if retaining.
         """
         width, height, rgba, depth, _ = pyb.getCameraImage(
             width=self._width,
@@ -72,17 +136,110 @@ class PerspectiveCamera:
             viewMatrix=self._view_matrix,
             projectionMatrix=self._proj_matrix,
             shadow=self._shadows,
-            lightDirection=[1, 1, 1],
+            lightDirection=self._light_dir,
             physicsClientId=self._client_id,
-            renderer=pyb.ER_BULLET_HARDWARE_OPENGL,
-            flags=pyb.ER_NO_SEGMENTATION_MASK 
+            renderer=self._renderer,
+            flags=self._flags
             )
         
         if mode == 'rgba':
-            img = np.array(rgba, dtype=np.uint8).reshape(height, width, 4)
+            np.copyto(self._out_rgba, self._as_array(rgba, np.uint8).reshape(height, width, 4))
+            img = self._out_rgba
         elif mode == 'depth':
-            img = np.array(depth, dtype=np.float32).reshape(height, width, 1)
+            np.copyto(self._out_depth, self._as_array(depth, np.float32).reshape(height, width, 1))
+            img = self._out_depth
         else:
             raise Exception(f"Mode '{mode}' not understood.")
 
+        if dtype is not None:
+            img = img.astype(dtype, copy=False)
+
         return img
+
+    def get_depth(self, dtype: np.dtype = None) -> np.ndarray:
+        """Depth-only fast path. Always renders through PyBullet's TinyRenderer,
+        which skips the shader and shadow setup of the hardware renderer; for
+        consumers that never look at the color image this avoids the full
+        fragment-shading pass per frame.
+
+        Args:
+            dtype (np.dtype): Optional output dtype (see `get_image`).
+
+        Returns:
+            np.ndarray: Depth frame of shape (height, width, 1). The buffer is
+                        reused across calls; copy if retaining.
+        """
+        width, height, _, depth, _ = pyb.getCameraImage(
+            width=self._width,
+            height=self._height,
+            viewMatrix=self._view_matrix,
+            projectionMatrix=self._proj_matrix,
+            shadow=0,
+            physicsClientId=self._client_id,
+            renderer=pyb.ER_TINY_RENDERER,
+            flags=self._flags
+            )
+
+        np.copyto(self._out_depth, self._as_array(depth, np.float32).reshape(height, width, 1))
+
+        if dtype is not None:
+            return self._out_depth.astype(dtype, copy=False)
+
+        return self._out_depth
+
+    def _as_array(self, pixels, dtype: np.dtype) -> np.ndarray:
+        """Wrap the pixel data returned by PyBullet as a flat ndarray, avoiding a
+        copy when the renderer returns a buffer-protocol object rather than a
+        tuple of Python ints (as the hardware OpenGL renderer does).
+
+        Args:
+            pixels:           Pixel data as returned by `pyb.getCameraImage`.
+            dtype (np.dtype): Element type of the pixel data.
+
+        Returns:
+            np.ndarray: Flat array over the pixel data (zero-copy when possible).
+        """
+        try:
+            return np.frombuffer(pixels, dtype=dtype)
+        except TypeError:
+            return np.array(pixels, dtype=dtype)
+
+    def get_image_async(self, mode: str = "rgba", dtype: np.dtype = None) -> Future:
+        """Fetch the current camera image on a background thread, allowing the
+        physics loop to advance while the OpenGL readback is in flight.
+
+        Args:
+            mode (str):       "rgba" or "depth"
+            dtype (np.dtype): Optional output dtype (see `get_image`).
+
+        Returns:
+            Future: Future resolving to the image frame (see `get_image`). Call
+                    `.result()` to block until the readback has completed.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+
+        return self._executor.submit(self.get_image, mode, dtype)
+
+    def get_image_if_due(self, interval_s: float, mode: str = "rgba", dtype: np.dtype = None) -> np.ndarray | None:
+        """Fetch the current camera image, but only if at least `interval_s` seconds
+        have passed since the last render; otherwise return None without touching
+        the renderer. Lets simulation loops cap their render rate and skip GPU
+        readbacks for frames that would never be displayed.
+
+        Args:
+            interval_s (float): Minimum time between renders in seconds
+                                (e.g. 1/30. for at most 30 frames per second).
+            mode (str):         "rgba" or "depth"
+            dtype (np.dtype):   Optional output dtype (see `get_image`).
+
+        Returns:
+            np.ndarray | None: Image frame (see `get_image`), or None if the
+                               previous frame is younger than `interval_s`.
+        """
+        now = time.perf_counter()
+        if now - self._last_render_t < interval_s:
+            return None
+
+        self._last_render_t = now
+        return self.get_image(mode, dtype)